@@ -87,18 +87,37 @@ class ChatChunk(TypedDict):
     response_delta: str
     reasoning_delta: str
 
+
+# reasoning tag pairs recognized in model output, shared by all results
+THINKING_PAIRS = (("<think>", "</think>"), ("<reasoning>", "</reasoning>"))
+
+
 class ChatGenerationResult:
     """Chat generation result object"""
+    __slots__ = (
+        "reasoning",
+        "response",
+        "thinking",
+        "thinking_tag",
+        "unprocessed",
+        "native_reasoning",
+        "thinking_pairs",
+    )
+
     def __init__(self, chunk: ChatChunk|None = None):
+        self.thinking_pairs = THINKING_PAIRS
+        self.reset()
+        if chunk:
+            self.add_chunk(chunk)
+
+    def reset(self):
+        """Clear accumulated output and parser state so the object can be reused"""
         self.reasoning = ""
         self.response = ""
         self.thinking = False
         self.thinking_tag = ""
         self.unprocessed = ""
         self.native_reasoning = False
-        self.thinking_pairs = [("<think>", "</think>"), ("<reasoning>", "</reasoning>")]
-        if chunk:
-            self.add_chunk(chunk)
 
     def add_chunk(self, chunk: ChatChunk) -> ChatChunk:
         if chunk["reasoning_delta"]:
@@ -136,7 +155,8 @@ class ChatGenerationResult:
                 else:
                     reasoning += response
                     response = ""
-        else:
+        elif response.startswith("<"):
+            # every opening tag starts with "<", plain text skips the tag scan entirely
             for opening_tag, closing_tag in self.thinking_pairs:
                 if response.startswith(opening_tag):
                     response = response[len(opening_tag):]
@@ -165,25 +185,27 @@ class ChatGenerationResult:
         return ChatChunk(response_delta=response, reasoning_delta=reasoning)
 
     def _is_partial_opening_tag(self, text: str, opening_tag: str) -> bool:
-        for i in range(1, len(opening_tag)):
-            if text == opening_tag[:i]:
-                return True
-        return False
+        # text is a proper, non-empty prefix of the tag
+        return 0 < len(text) < len(opening_tag) and opening_tag.startswith(text)
 
     def _is_partial_closing_tag(self, text: str) -> bool:
         if not self.thinking_tag or not text:
             return False
-        max_check = min(len(text), len(self.thinking_tag) - 1)
-        for i in range(1, max_check + 1):
-            if text.endswith(self.thinking_tag[:i]):
+        # a partial tag can only begin at a "<" within the last len(tag) - 1 characters
+        lead = self.thinking_tag[0]
+        pos = text.find(lead, max(0, len(text) - len(self.thinking_tag) + 1))
+        while pos != -1:
+            if self.thinking_tag.startswith(text[pos:]):
                 return True
+            pos = text.find(lead, pos + 1)
         return False
 
     def output(self) -> ChatChunk:
         response = self.response
         reasoning = self.reasoning
         if self.unprocessed:
-            if reasoning and not response:
+            # held back inside an open reasoning block, or after reasoning-only output
+            if self.thinking or (reasoning and not response):
                 reasoning += self.unprocessed
             else:
                 response += self.unprocessed
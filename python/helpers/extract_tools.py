@@ -9,9 +9,16 @@ from typing import Any, Type, TypeVar
 
 import regex
 
-from .dirty_json import DirtyJson
+from . import dirty_json
 from .files import get_abs_path
 
+# Balanced JSON object or array (recursive), string, literal or number
+_JSON_VALUE_RE = regex.compile(
+    r'\{(?:[^{}]|(?R))*\}|\[(?:[^\[\]]|(?R))*\]|"(?:\\.|[^"\\])*"|true|false|null|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
+)
+# JSON string value following a key, used to escape raw line breaks inside it
+_JSON_STRING_VALUE_RE = re.compile(r'(?<=: ")(.*?)(?=")', re.DOTALL)
+
 
 def json_parse_dirty(json:str) -> dict[str,Any] | None:
     if not json or not isinstance(json, str):
@@ -20,14 +27,15 @@ def json_parse_dirty(json:str) -> dict[str,Any] | None:
     ext_json = extract_json_object_string(json.strip())
     if ext_json:
         try:
-            data = DirtyJson.parse_string(ext_json)
+            # well-formed output takes the C json parser, DirtyJson only handles the rest
+            data = dirty_json.try_parse(ext_json)
             if isinstance(data,dict): return data
         except Exception:
             # If parsing fails, return None instead of crashing
             return None
     return None
 
-def extract_json_object_string(content):
+def extract_json_object_string(content: str) -> str:
     start = content.find('{')
     if start == -1:
         return ""
@@ -41,12 +49,9 @@ def extract_json_object_string(content):
         # If there's a closing '}', return the substring from start to end
         return content[start:end+1]
 
-def extract_json_string(content):
-    # Regular expression pattern to match a JSON object
-    pattern = r'\{(?:[^{}]|(?R))*\}|\[(?:[^\[\]]|(?R))*\]|"(?:\\.|[^"\\])*"|true|false|null|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
-
+def extract_json_string(content: str) -> str:
     # Search for the pattern in the content
-    match = regex.search(pattern, content)
+    match = _JSON_VALUE_RE.search(content)
 
     if match:
         # Return the matched JSON string
@@ -54,13 +59,13 @@ def extract_json_string(content):
     else:
         return ""
 
-def fix_json_string(json_string):
+def fix_json_string(json_string: str) -> str:
     # Function to replace unescaped line breaks within JSON string values
-    def replace_unescaped_newlines(match):
+    def replace_unescaped_newlines(match: re.Match[str]) -> str:
         return match.group(0).replace('\n', '\\n')
 
     # Use regex to find string values and apply the replacement function
-    fixed_string = re.sub(r'(?<=: ")(.*?)(?=")', replace_unescaped_newlines, json_string, flags=re.DOTALL)
+    fixed_string = _JSON_STRING_VALUE_RE.sub(replace_unescaped_newlines, json_string)
     return fixed_string
 
 
@@ -1,4 +1,5 @@
 import base64
+import functools
 import glob
 import json
 import mimetypes
@@ -74,6 +75,11 @@ def load_plugin_variables(
 
 from python.helpers.strings import sanitize_string
 
+# {{name}} placeholder, the name is matched verbatim as passed in kwargs
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+# Code fence with optional language specifier, re.DOTALL makes '.' match newlines
+_CODE_FENCE_PATTERN = re.compile(r"(```|~~~)(.*?\n)(.*?)(\1)", re.DOTALL)
+
 
 def parse_file(
     _filename: str, _directories: list[str] | None = None, _encoding="utf-8", **kwargs
@@ -175,12 +181,15 @@ def read_file_base64(relative_path):
 
 
 def replace_placeholders_text(_content: str, **kwargs):
-    # Replace placeholders with values from kwargs
-    for key, value in kwargs.items():
-        placeholder = "{{" + key + "}}"
-        strval = str(value)
-        _content = _content.replace(placeholder, strval)
-    return _content
+    # Replace placeholders with values from kwargs in a single pass, unknown ones are kept
+    if not kwargs or "{{" not in _content:
+        return _content
+
+    def _repl(match):
+        key = match.group(1)
+        return str(kwargs[key]) if key in kwargs else match.group(0)
+
+    return _PLACEHOLDER_PATTERN.sub(_repl, _content)
 
 
 def replace_placeholders_json(_content: str, **kwargs):
@@ -276,17 +285,15 @@ def get_unique_filenames_in_dirs(dir_paths: list[str], pattern: str = "*"):
 
 
 def remove_code_fences(text):
-    # Pattern to match code fences with optional language specifier
-    pattern = r"(```|~~~)(.*?\n)(.*?)(\1)"
+    # Plain text without any fence marker needs no regex pass
+    if "```" not in text and "~~~" not in text:
+        return text
 
     # Function to replace the code fences
     def replacer(match):
         return match.group(3)  # Return the code without fences
 
-    # Use re.DOTALL to make '.' match newlines
-    result = re.sub(pattern, replacer, text, flags=re.DOTALL)
-
-    return result
+    return _CODE_FENCE_PATTERN.sub(replacer, text)
 
 
 def is_full_json_template(text):
@@ -431,8 +438,9 @@ def exists(*relative_paths):
     return os.path.exists(path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_base_dir():
-    # Get the base directory from the current file path
+    # Get the base directory from the current file path, it never changes at runtime
     base_dir = os.path.dirname(os.path.abspath(os.path.join(__file__, "../../")))
     return base_dir
 
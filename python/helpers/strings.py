@@ -1,3 +1,4 @@
+import functools
 import re
 import sys
 import time
@@ -9,6 +10,9 @@ def sanitize_string(s: str, encoding: str = "utf-8") -> str:
     # Replace surrogates and invalid unicode with replacement character
     if not isinstance(s, str):
         s = str(s)
+    # ASCII text round-trips unchanged, skip the two copies
+    if s.isascii():
+        return s
     return s.encode(encoding, 'replace').decode(encoding, 'replace')
 
 def calculate_valid_match_lengths(first: bytes | str, second: bytes | str,
@@ -25,6 +29,11 @@ def calculate_valid_match_lengths(first: bytes | str, second: bytes | str,
     matched_since_deviation = 0
     last_matched_i, last_matched_j = 0, 0  # Track the last matched index
 
+    # Without ignore patterns, consume the common prefix at once instead of char by char
+    if not ignore_patterns and not debug:
+        i = j = last_matched_i = last_matched_j = _common_prefix_length(first, second)
+        matched_since_deviation = i % deviation_reset if deviation_reset > 0 else 0
+
     def skip_ignored_patterns(s, index):
         """Skip characters in `s` that match any pattern in `ignore_patterns` starting from `index`."""
         while index < len(s):
@@ -98,31 +107,49 @@ def calculate_valid_match_lengths(first: bytes | str, second: bytes | str,
     # Return the last matched positions instead of the current indices
     return last_matched_i, last_matched_j
 
+def _common_prefix_length(first: bytes | str, second: bytes | str) -> int:
+    # Binary search over slice comparisons, each of them a C-level memcmp
+    lo, hi = 0, min(len(first), len(second))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if first[:mid] == second[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+@functools.lru_cache(maxsize=1024)
 def format_key(key: str) -> str:
     """Format a key string to be more readable.
     Converts camelCase and snake_case to Title Case with spaces."""
-    # First replace non-alphanumeric with spaces
-    result = ''.join(' ' if not c.isalnum() else c for c in key)
-
-    # Handle camelCase
-    formatted = ''
-    for i, c in enumerate(result):
-        if i > 0 and c.isupper() and result[i-1].islower():
-            formatted += ' ' + c
-        else:
-            formatted += c
-
-    # Split on spaces and capitalize each word
-    return ' '.join(word.capitalize() for word in formatted.split())
+    # Single pass: words end at non-alphanumerics and at camelCase lower-to-upper steps
+    words = []
+    start = -1
+    prev_lower = False
+    for i, c in enumerate(key):
+        if not c.isalnum():
+            if start != -1:
+                words.append(key[start:i])
+                start = -1
+            prev_lower = False
+            continue
+        if start == -1:
+            start = i
+        elif prev_lower and c.isupper():
+            words.append(key[start:i])
+            start = i
+        prev_lower = c.islower()
+    if start != -1:
+        words.append(key[start:])
+
+    # Capitalize each word, interned since formatted keys repeat and end up as dict keys
+    return sys.intern(' '.join(word.capitalize() for word in words))
 
 def dict_to_text(d: dict) -> str:
-    parts = []
-    for key, value in d.items():
-        parts.append(f"{format_key(str(key))}:")
-        parts.append(f"{value}")
-        parts.append("")  # Add empty line between entries
-
-    return "\n".join(parts).rstrip()  # rstrip to remove trailing newline
+    # One formatted entry per key, separated by an empty line
+    return "\n\n".join(
+        f"{format_key(str(key))}:\n{value}" for key, value in d.items()
+    ).rstrip()  # rstrip to remove trailing whitespace of the last value
 
 def truncate_text(text: str, length: int, at_end: bool = True, replacement: str = "...") -> str:
     orig_length = len(text)
@@ -158,7 +185,8 @@ def truncate_text_by_ratio(text: str, threshold: int, replacement: str = "...",
         # Replace in middle based on ratio
         start_len = int(available_space * ratio)
         end_len = available_space - start_len
-        return text[:start_len] + replacement + text[-end_len:]
+        # one f-string builds the result without an intermediate concatenation
+        return f"{text[:start_len]}{replacement}{text[-end_len:]}"
 
 
 def replace_file_includes(text: str, placeholder_pattern: str = r"§§include\(([^)]+)\)") -> str:
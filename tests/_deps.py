@@ -0,0 +1,29 @@
+import importlib
+
+import pytest
+
+HEAVY_ML_DEPS = ("sentence_transformers", "litellm")
+
+# module name -> whether it imported cleanly, probed once per session
+_HEAVY_DEPS: dict[str, bool] = {}
+
+
+def require_heavy(name: str) -> bool:
+    """Return whether a heavy dependency can be imported, importing it at most once."""
+    if name not in _HEAVY_DEPS:
+        try:
+            importlib.import_module(name)
+            _HEAVY_DEPS[name] = True
+        except ImportError:
+            # missing, or installed but broken - both skip like pytest.importorskip
+            _HEAVY_DEPS[name] = False
+    return _HEAVY_DEPS[name]
+
+
+def require_heavy_ml_deps():
+    """Skip the calling test module if any heavy ML dependency is missing.
+    Call at module level, before importing anything that depends on them."""
+    __tracebackhide__ = True  # report the skip at the calling module, not here
+    for name in HEAVY_ML_DEPS:
+        if not require_heavy(name):
+            pytest.skip(f"{name} not installed", allow_module_level=True)
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+# make the project root importable for every test module, once
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def _chat_result():
+    import models
+
+    return models.ChatGenerationResult()
+
+
+@pytest.fixture
+def fresh_chat_result(_chat_result):
+    """A ChatGenerationResult shared across tests, reset before each one."""
+    _chat_result.reset()
+    return _chat_result
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sample-one",
+        action="store_true",
+        default=False,
+        help="run only the first case of tests marked sample_one",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "sample_one: parametrized matrix that --sample-one trims to its first case"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--sample-one"):
+        return
+    seen = set()
+    selected, deselected = [], []
+    for item in items:
+        if item.get_closest_marker("sample_one"):
+            key = (item.parent.nodeid, getattr(item, "originalname", item.name))
+            if key in seen:
+                deselected.append(item)
+                continue
+            seen.add(key)
+        selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -1,8 +1,9 @@
 import pytest
 
+from tests._deps import require_heavy_ml_deps
+
 # Skip if heavy ML dependencies are not installed
-pytest.importorskip('sentence_transformers', reason='sentence_transformers not installed')
-pytest.importorskip('litellm', reason='litellm not installed')
+require_heavy_ml_deps()
 
 import os
 
@@ -10,9 +11,6 @@ import os
 if os.environ.get('CI') or os.environ.get('GITHUB_ACTIONS'):
     pytest.skip('Skipping tests requiring runtime environment in CI', allow_module_level=True)
 
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import models
 
 
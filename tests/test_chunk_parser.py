@@ -0,0 +1,95 @@
+import pytest
+
+from tests._deps import require_heavy_ml_deps
+
+# Skip if heavy ML dependencies are not installed
+require_heavy_ml_deps()
+
+import os
+
+# Skip in CI environment - these tests require runtime environment
+if os.environ.get('CI') or os.environ.get('GITHUB_ACTIONS'):
+    pytest.skip('Skipping tests requiring runtime environment in CI', allow_module_level=True)
+
+# example, expected reasoning, expected response
+CASES = [
+    pytest.param("response goes here", "", "response goes here", id="plain"),
+    pytest.param(
+        "<think>reasoning goes here</thi", "reasoning goes here</thi", "", id="partial_think"
+    ),
+    pytest.param(
+        "<think>reasoning goes here</think>response goes here",
+        "reasoning goes here",
+        "response goes here",
+        id="full",
+    ),
+]
+
+
+@pytest.mark.parametrize("example, reasoning, response", CASES)
+def test_example(example: str, reasoning: str, response: str, fresh_chat_result):
+    res = fresh_chat_result
+    payload = {"response_delta": "", "reasoning_delta": ""}
+    out = []
+    for i, char in enumerate(example):
+        payload["response_delta"] = char
+        out.append((i, res.add_chunk(payload)))
+    # run with -s to see the per-character chunks
+    if os.environ.get("VERBOSE_CHUNK_TEST"):
+        for i, chunk in out:
+            print(i, ":", chunk)
+    output = res.output()
+    assert output["reasoning_delta"] == reasoning
+    assert output["response_delta"] == response
+
+
+@pytest.mark.sample_one
+@pytest.mark.parametrize("size", [1, 4, 16, None])
+@pytest.mark.parametrize("example, reasoning, response", CASES)
+def test_example_bulk(
+    example: str, reasoning: str, response: str, size: int | None, fresh_chat_result
+):
+    size = size or len(example)
+    res = fresh_chat_result
+    for i in range(0, len(example), size):
+        res.add_chunk({"response_delta": example[i:i + size], "reasoning_delta": ""})
+    # the split must not change which side any text lands on
+    output = res.output()
+    assert output["reasoning_delta"] == reasoning
+    assert output["response_delta"] == response
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("<", True),
+        ("<thi", True),
+        ("<think", True),
+        ("<think>", False),
+        ("", False),
+        ("x<", False),
+        ("<tx", False),
+    ],
+)
+def test_is_partial_opening_tag(text: str, expected: bool, fresh_chat_result):
+    assert fresh_chat_result._is_partial_opening_tag(text, "<think>") is expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("abc<", True),
+        ("abc</thin", True),
+        ("</think", True),
+        ("a<b</t", True),
+        ("abc", False),
+        ("abc</x", False),
+        ("<a", False),
+        ("", False),
+    ],
+)
+def test_is_partial_closing_tag(text: str, expected: bool, fresh_chat_result):
+    res = fresh_chat_result
+    res.thinking = True
+    res.thinking_tag = "</think>"
+    assert res._is_partial_closing_tag(text) is expected
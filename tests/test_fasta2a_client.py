@@ -3,11 +3,20 @@
 Test script to verify FastA2A agent card routing and authentication.
 """
 
+import sys
+from pathlib import Path
+
 import pytest
 
+# this file also runs as a script, where conftest.py does not set up the path
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tests._deps import require_heavy_ml_deps
+
 # Skip if heavy ML dependencies are not installed
-pytest.importorskip('sentence_transformers', reason='sentence_transformers not installed')
-pytest.importorskip('litellm', reason='litellm not installed')
+require_heavy_ml_deps()
 
 import os
 
@@ -15,11 +24,6 @@ import os
 if os.environ.get('CI') or os.environ.get('GITHUB_ACTIONS'):
     pytest.skip('Skipping integration tests in CI', allow_module_level=True)
 
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
 import asyncio
 
 from python.helpers import settings
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+CONFTEST = Path(__file__).with_name("conftest.py").read_text()
+
+SAMPLE_TESTS = """
+import pytest
+
+@pytest.mark.sample_one
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_x(n):
+    pass
+
+class TestC:
+    @pytest.mark.sample_one
+    @pytest.mark.parametrize("n", [1, 2, 3])
+    def test_x(self, n):
+        pass
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_unmarked(n):
+    pass
+"""
+
+
+def test_sample_one_keeps_every_case_by_default(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    result = pytester.runpytest("-p", "no:asyncio")
+    result.assert_outcomes(passed=8)
+
+
+def test_sample_one_keeps_first_case_per_test(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    result = pytester.runpytest("-p", "no:asyncio", "--sample-one", "-v")
+    result.assert_outcomes(passed=4, deselected=4)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_sample.py::test_x?1? PASSED*",
+            "*test_sample.py::TestC::test_x?1? PASSED*",
+        ]
+    )
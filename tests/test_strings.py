@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+# strings and files import each other, so files has to load first
+from python.helpers import files, strings  # noqa: F401
+
+
+def slow_path(monkeypatch, capsys, first, second, **kwargs):
+    # debug=True disables the common-prefix shortcut, leaving the char-by-char walk
+    monkeypatch.setattr(strings.time, "sleep", lambda _: None)
+    result = strings.calculate_valid_match_lengths(first, second, debug=True, **kwargs)
+    capsys.readouterr()
+    return result
+
+
+def tail(prefix_length):
+    base = "abcdefghijklmnopqrstuvwxyz"
+    prefix = base[:prefix_length]
+    return (
+        prefix + "XY" + "0123456789" + "Q" + "tail end",
+        prefix + "0123456789" + "RS" + "tail end",
+    )
+
+
+@pytest.mark.parametrize("deviation_reset", [5, 3, 1, 0, -1])
+@pytest.mark.parametrize("prefix_length", [0, 3, 5, 7, 10, 15, 26])
+def test_fast_path_matches_slow_path(monkeypatch, capsys, prefix_length, deviation_reset):
+    first, second = tail(prefix_length)
+    kwargs = dict(deviation_threshold=3, deviation_reset=deviation_reset)
+    expected = slow_path(monkeypatch, capsys, first, second, **kwargs)
+    assert strings.calculate_valid_match_lengths(first, second, **kwargs) == expected
+
+
+@pytest.mark.parametrize("deviation_reset", [5, 0])
+@pytest.mark.parametrize("prefix_length", [3, 5, 10])
+def test_fast_path_matches_slow_path_bytes(monkeypatch, capsys, prefix_length, deviation_reset):
+    first, second = (s.encode() for s in tail(prefix_length))
+    kwargs = dict(deviation_threshold=3, deviation_reset=deviation_reset)
+    expected = slow_path(monkeypatch, capsys, first, second, **kwargs)
+    assert strings.calculate_valid_match_lengths(first, second, **kwargs) == expected
+
+
+@pytest.mark.parametrize("first,second", [(b"abcdef", "abcdef"), ("abcdef", b"abcdef")])
+def test_mixed_bytes_and_str_never_match(monkeypatch, capsys, first, second):
+    assert slow_path(monkeypatch, capsys, first, second) == (0, 0)
+    assert strings.calculate_valid_match_lengths(first, second) == (0, 0)
+
+
+def test_fast_path_matches_slow_path_random(monkeypatch, capsys):
+    rng = random.Random(0)
+    for _ in range(200):
+        first = "".join(rng.choices("ab", k=rng.randint(0, 30)))
+        second = "".join(rng.choices("ab", k=rng.randint(0, 30)))
+        kwargs = dict(
+            deviation_threshold=rng.randint(0, 5), deviation_reset=rng.randint(-1, 6)
+        )
+        expected = slow_path(monkeypatch, capsys, first, second, **kwargs)
+        assert strings.calculate_valid_match_lengths(first, second, **kwargs) == expected
+
+
+
+@pytest.mark.parametrize("size", [31, 32, 33])
+def test_dict_to_text(size):
+    d = {f"entry_{n}": f"value {n}  " for n in range(size - 1)}
+    d["lastKey"] = "trailing whitespace \t\n "
+    entries = [f"Entry {n}:\nvalue {n}  " for n in range(size - 1)]
+    expected = "\n\n".join(entries + ["Last Key:\ntrailing whitespace"])
+    assert strings.dict_to_text(d) == expected